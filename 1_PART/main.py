@@ -3,41 +3,186 @@
 from pypdf import PdfReader
 from dotenv import load_dotenv
 import os
-from openai import OpenAI
+import sys
+import asyncio
+from openai import OpenAI, DefaultHttpxClient
+import importlib.util
+import importlib.metadata
+from functools import lru_cache
+import threading
+import hashlib
+import re
+import tiktoken
+import json
+import tempfile
+import time
+from pathlib import Path
 
-# Load environment variables from .env file
-load_dotenv()
+# Optional fast path: pypdfium2 uses the native PDFium engine
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
 
-client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
+# The lock stops concurrent first calls (batch_summarize threads) from each building a client
+_client_lock = threading.Lock()
+
+def get_client():
+    """Returns the shared OpenAI client, building it on first use."""
+
+    with _client_lock:
+        return _create_client()
+
+@lru_cache(maxsize=1)
+def _create_client():
+    """Loads .env and builds the OpenAI client once; later calls reuse it."""
+
+    load_dotenv()
+
+    # Reuse pooled connections; use HTTP/2 when the optional "h2" package is installed
+    return OpenAI(
+        api_key=os.getenv("OPENAI_API_KEY"),
+        http_client=DefaultHttpxClient(http2=importlib.util.find_spec("h2") is not None),
+    )
+
+# Input token budget; gpt-5-mini shares gpt-4o's o200k_base tokenizer
+MAX_TOKENS = 3000
+ENCODING = tiktoken.encoding_for_model("gpt-4o")
+
+def truncate_to_tokens(text, max_tokens=MAX_TOKENS):
+    """Squeezes repeated whitespace and cuts text to at most max_tokens tokens."""
+
+    text = re.sub(r"[ \t]+", " ", text)
+    text = re.sub(r"\s*\n\s*", "\n", text).strip()
+    tokens = ENCODING.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return ENCODING.decode(tokens[:max_tokens])
+
+# Token/cache helpers are shared copies of main.py and 2_PART/meeting_notes/core.py; keep them identical
+# Identical reruns are served from disk instead of calling the API again
+CACHE_DIR = Path(".llm_cache")
+CACHE_TTL_DAYS = 30
+
+# Extracted PDF text is cached per file content and extractor version
+PDF_CACHE_DIR = Path(".pdf_cache")
+PDF_BACKEND = (
+    f"pypdfium2-{importlib.metadata.version('pypdfium2')}"
+    if pdfium is not None
+    else f"pypdf-{importlib.metadata.version('pypdf')}"
+)
+
+def cache_key(model, prompt):
+    """Builds a deterministic SHA256 cache key for a model + prompt pair."""
+
+    return hashlib.sha256(f"{model}\0{prompt}".encode("utf-8")).hexdigest()
+
+def file_sha256(path):
+    """Hashes a file's bytes in chunks."""
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        # Read 1 MB at a time until read() returns b"" (end of file)
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def get_or_set(key, compute, ttl_days=CACHE_TTL_DAYS, cache_dir=CACHE_DIR):
+    """Returns the cached value for key, or calls compute() and caches its result."""
+
+    cache_path = cache_dir / f"{key}.json"
+    if cache_path.exists():
+        entry = json.loads(cache_path.read_text(encoding="utf-8"))
+        if time.time() - entry["created_at"] < ttl_days * 86400:
+            return entry["value"]
+
+    value = compute()
+
+    # Write to a temp file and rename it so the cache file is never half-written
+    cache_dir.mkdir(exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", dir=cache_dir, suffix=".tmp", delete=False, encoding="utf-8") as tmp_file:
+        json.dump({"created_at": time.time(), "value": value}, tmp_file)
+    os.replace(tmp_file.name, cache_path)
+    return value
 
 def read_pdf(file_path):
-    """Reads a PDF file and extracts its text content."""
+    """Reads a PDF file and extracts its text content, cached by file hash."""
+
+    key = f"{file_sha256(file_path)}-{PDF_BACKEND}"
+    return get_or_set(key, lambda: extract_pdf_text(file_path), cache_dir=PDF_CACHE_DIR)
+
+def extract_pdf_text(file_path):
+    """Extracts PDF text with PDFium if installed, else pypdf."""
+
+    if pdfium is not None:
+        try:
+            return read_pdf_pdfium(file_path)
+        except pdfium.PdfiumError:
+            pass
+    return read_pdf_pypdf(file_path)
+
+def read_pdf_pdfium(file_path):
+    """Extracts PDF text with pypdfium2."""
+
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        return "\n".join(page.get_textpage().get_text_range() for page in pdf)
+    finally:
+        pdf.close()
+
+def read_pdf_pypdf(file_path):
+    """Extracts PDF text with pypdf."""
 
     reader = PdfReader(file_path)
-    text = ""
-    for page in reader.pages:
-        text += page.extract_text() 
-    return text
+    return "".join(page.extract_text() or "" for page in reader.pages)
 
 def summarize_text(text):
-    text = text[:4000]
+    text = truncate_to_tokens(text)
 
-    response = client.responses.create(
-        model="gpt-5-mini",
-        input=("Summarize the following text in simple and clear language:\n\n" + text)
-    )
+    model = "gpt-5-mini"
+    prompt = "Summarize the following text in simple and clear language:\n\n" + text
+
+    def call_model():
+        response = get_client().responses.create(model=model, input=prompt)
+        return response.output_text
+
+    return get_or_set(cache_key(model, prompt), call_model)
+
+
+def summarize_pdf(file_path):
+    """Reads one PDF and returns its summary."""
+
+    pdf_text = read_pdf(file_path)
+    if not pdf_text.strip():
+        raise ValueError(f"{file_path}: The PDF file is empty or could not be read.")
+    return summarize_text(pdf_text)
+
+async def batch_summarize(paths, workers=4):
+    """Summarizes several PDFs concurrently; returns a summary or exception per path."""
+
+    semaphore = asyncio.Semaphore(workers)
+
+    async def summarize_one(path):
+        async with semaphore:
+            return await asyncio.to_thread(summarize_pdf, path)
 
-    return response.output_text
+    return await asyncio.gather(*(summarize_one(path) for path in paths), return_exceptions=True)
 
 
 # Main Execution Flow:
 
-pdf_text = read_pdf("Hemant_Resume_DPJ.pdf")
+pdf_paths = sys.argv[1:] or ["Hemant_Resume_DPJ.pdf"]
 
-if not pdf_text.strip():
-    ValueError("The PDF file is empty or could not be read.")   
+summaries = asyncio.run(batch_summarize(pdf_paths))
 
-summary = summarize_text(pdf_text)
+failed = False
+for pdf_path, summary in zip(pdf_paths, summaries):
+    if isinstance(summary, Exception):
+        print(f"Could not summarize {pdf_path}: {summary}")
+        failed = True
+    else:
+        print(f"Summary of the PDF content ({pdf_path}):")
+        print(summary)
 
-print("Summary of the PDF content:")
-print(summary) 
+if failed:
+    sys.exit(1)
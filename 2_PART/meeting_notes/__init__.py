@@ -0,0 +1,11 @@
+# AI Meeting Notes Generator: audio → transcript → structured notes file
+
+from .core import (
+    generate_meeting_notes,
+    get_client,
+    main,
+    save_notes,
+    segregate_notes,
+    transcribe_all,
+    transcribe_audio,
+)
@@ -0,0 +1,7 @@
+# Lets you run the generator with: python -m meeting_notes
+
+import asyncio
+
+from .core import main
+
+asyncio.run(main())
@@ -0,0 +1,528 @@
+# ============================================================
+# AI MEETING NOTES GENERATOR — CORE
+# ============================================================
+
+# Meeting Audio → Speech to Text → AI Understanding → Structured Notes → Save File
+# All the steps live here; main.py and "python -m meeting_notes" just run main().
+
+# -------------------------------
+# IMPORT REQUIRED MODULES
+# -------------------------------
+
+from dotenv import load_dotenv   # Loads environment variables from .env file
+import asyncio                   # Runs blocking API calls concurrently
+import os                        # Used to access system environment variables
+from openai import OpenAI        # Official OpenAI SDK
+from openai import DefaultHttpxClient  # HTTP client with the SDK's default settings
+import httpx                     # Timeout settings (installed with openai)
+import importlib.util            # Checks if optional packages are installed
+from functools import lru_cache  # Builds the client only once
+import hashlib                   # Builds deterministic cache keys
+import re                        # Squeezes whitespace, detects note headings
+import tiktoken                  # Counts tokens exactly like the model does
+import json                      # Stores cached AI responses on disk
+import tempfile                  # Writes cache files atomically
+import time                      # Expires old cache entries
+from pathlib import Path         # Works with cache file paths
+import io                        # In-memory buffers for audio chunks
+from concurrent.futures import ThreadPoolExecutor  # Transcribes chunks in parallel
+import threading                 # Shared request limit, guarded client creation
+import subprocess                # Runs ffmpeg to decode audio windows
+
+# Optional: pydub (needs ffmpeg) splits long recordings at silent pauses.
+# Without it, every recording is sent as one request.
+try:
+    from pydub import AudioSegment
+    from pydub.exceptions import CouldntEncodeError
+    from pydub.silence import detect_silence
+except ImportError:
+    AudioSegment = None
+    CouldntEncodeError = None
+
+
+# -------------------------------
+# LOAD API KEY SECURELY
+# -------------------------------
+
+# lru_cache → the first call creates the client, every later call
+# (and every import of this module) gets the very same object back.
+# The first call happens inside worker threads (transcribe_all, chunk pool),
+# and lru_cache alone would let each of them build its own client — so a lock
+# makes sure only one thread ever runs _create_client().
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """
+    Returns the shared OpenAI client (created on first use).
+    """
+
+    with _client_lock:
+        return _create_client()
+
+
+@lru_cache(maxsize=1)
+def _create_client():
+    """
+    Loads the API key and builds the OpenAI client (only called through get_client).
+    """
+
+    load_dotenv()  # Reads .env file and loads variables into system
+
+    # Fetch API key from environment variables
+    api_key = os.getenv("OPENAI_API_KEY")
+
+    # Safety check to ensure API key exists
+    if not api_key:
+        raise ValueError("OPENAI_API_KEY not found in .env file")
+
+    # Create OpenAI client object.
+    # Transcription and notes share its connection pool; with the optional
+    # "h2" package installed, HTTP/2 puts both on one TLS connection.
+    return OpenAI(
+        api_key=api_key,
+        http_client=DefaultHttpxClient(http2=importlib.util.find_spec("h2") is not None)
+    )
+
+
+# -------------------------------
+# TOKEN BUDGET
+# -------------------------------
+
+# Maximum transcript tokens sent to the model per request
+MAX_TOKENS = 3000
+
+# gpt-5-mini uses the same tokenizer (o200k_base) as gpt-4o; load it once
+ENCODING = tiktoken.encoding_for_model("gpt-4o")
+
+
+def truncate_to_tokens(text, max_tokens=MAX_TOKENS):
+    """
+    Squeezes repeated whitespace and cuts text to at most max_tokens tokens.
+    """
+
+    # Extra spaces and blank lines cost tokens but add no meaning
+    text = re.sub(r"[ \t]+", " ", text)
+    text = re.sub(r"\s*\n\s*", "\n", text).strip()
+
+    tokens = ENCODING.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return ENCODING.decode(tokens[:max_tokens])
+
+
+# -------------------------------
+# RESPONSE CACHE
+# -------------------------------
+
+# Re-running on the same audio / transcript gives the same request,
+# so answers are saved in .llm_cache/<sha256>.json and reused.
+# The token/cache helpers are copies of the ones in the PDF scripts
+# (main.py, 1_PART/main.py); keep them identical.
+CACHE_DIR = Path(".llm_cache")
+CACHE_TTL_DAYS = 30
+
+
+def cache_key(model, prompt):
+    """
+    Builds a deterministic SHA256 cache key for a model + prompt pair.
+    """
+
+    # "\0" separates the parts so different pairs can never produce the same text
+    return hashlib.sha256(f"{model}\0{prompt}".encode("utf-8")).hexdigest()
+
+
+def file_sha256(path):
+    """
+    Hashes a file's bytes (read in chunks, so large audio stays out of memory).
+    """
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        # Read 1 MB at a time until read() returns b"" (end of file)
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def get_or_set(key, compute, ttl_days=CACHE_TTL_DAYS, cache_dir=CACHE_DIR):
+    """
+    Returns the cached value for key, or calls compute() and caches its result.
+    """
+
+    cache_path = cache_dir / f"{key}.json"
+
+    # Cache hit (and not expired) → skip the network call
+    if cache_path.exists():
+        entry = json.loads(cache_path.read_text(encoding="utf-8"))
+        if time.time() - entry["created_at"] < ttl_days * 86400:
+            return entry["value"]
+
+    value = compute()
+
+    # Temp file + rename → a crash never leaves a half-written cache file
+    cache_dir.mkdir(exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", dir=cache_dir, suffix=".tmp", delete=False, encoding="utf-8"
+    ) as tmp_file:
+        json.dump({"created_at": time.time(), "value": value}, tmp_file)
+    os.replace(tmp_file.name, cache_path)
+
+    return value
+
+
+# -------------------------------
+# STEP 1 — TRANSCRIBE AUDIO
+# -------------------------------
+
+# Timeouts for a whole-file transcription request. The SDK default is
+# 600s to read / 5s to connect; an unsplit hour-long recording can need
+# longer than 10 minutes to upload and transcribe, so only the read limit
+# is raised. Connecting still fails fast if the server is unreachable.
+TRANSCRIBE_TIMEOUT = httpx.Timeout(1800.0, connect=5.0)
+
+# Max transcription requests in flight at once, shared by all files and all
+# chunks (keeps us under API rate limits)
+MAX_CONCURRENT_TRANSCRIPTIONS = 4
+TRANSCRIBE_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_TRANSCRIPTIONS)
+
+# Recordings bigger than this are split at pauses and transcribed in parallel
+SPLIT_MIN_BYTES = 5 * 1024 * 1024
+
+# Longest audio chunk sent in one request (milliseconds)
+CHUNK_MAX_MS = 60_000
+
+# Each chunk is cut at the last pause found in its final CUT_SEARCH_MS
+CUT_SEARCH_MS = 10_000
+
+# Silence detection measures loudness every SILENCE_SEEK_MS instead of every 1 ms
+SILENCE_SEEK_MS = 100
+
+# Sample rate (Hz) audio windows are decoded at
+DECODE_RATE = 16_000
+
+# Errors from ffmpeg while splitting (ffmpeg missing → OSError, decoding failed
+# → CalledProcessError, mp3 export failed, e.g. no mp3 encoder →
+# CouldntEncodeError). On any of these we upload the whole file instead.
+SPLIT_ERRORS = (subprocess.CalledProcessError, OSError)
+if CouldntEncodeError is not None:
+    SPLIT_ERRORS += (CouldntEncodeError,)
+
+
+def transcribe_audio(audio_path):
+    """
+    Converts meeting audio into text using AI speech recognition.
+    """
+
+    model = "gpt-4o-mini-transcribe"   # Speech recognition model
+
+    def call_model():
+        # Long recording → split at pauses and transcribe the chunks in parallel
+        chunks = None
+        if AudioSegment is not None and os.path.getsize(audio_path) > SPLIT_MIN_BYTES:
+            try:
+                chunks = split_audio(audio_path)
+            except SPLIT_ERRORS as error:
+                print(f"⚠️ Could not split audio ({error}), sending it as one file")
+
+        if chunks:
+            with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_TRANSCRIPTIONS) as executor:
+                texts = executor.map(lambda chunk: transcribe_chunk(chunk, model), chunks)
+                return " ".join(texts)
+
+        # Open audio file in binary read mode.
+        # Pass the open file (not audio_file.read() or a Path): the SDK then
+        # streams it into the multipart upload chunk by chunk, so even a
+        # 100MB+ recording is never fully loaded into memory.
+        with open(audio_path, "rb") as audio_file, TRANSCRIBE_SLOTS:
+
+            # Call OpenAI speech-to-text model
+            transcription = get_client().with_options(
+                timeout=TRANSCRIBE_TIMEOUT
+            ).audio.transcriptions.create(
+                file=audio_file,   # Audio file input
+                model=model
+            )
+
+        # Return transcribed text
+        return transcription.text
+
+    # Same audio bytes → same transcript, so key the cache on the file hash
+    return get_or_set(cache_key(model, file_sha256(audio_path)), call_model)
+
+
+def decode_window(audio_path, start_ms):
+    """
+    Decodes CHUNK_MAX_MS of audio starting at start_ms into an AudioSegment.
+    """
+
+    # -ss / -t placed *before* -i are input options: ffmpeg seeks straight to
+    # start_ms and stops reading after CHUNK_MAX_MS. (pydub's from_file puts
+    # them after -i, which makes ffmpeg decode everything from 0 every time.)
+    # Output is raw 16 kHz mono 16-bit PCM: enough for speech, ~2 MB a minute.
+    result = subprocess.run(
+        [
+            AudioSegment.converter, "-v", "error",
+            "-ss", f"{start_ms / 1000:.3f}", "-t", f"{CHUNK_MAX_MS / 1000:.3f}",
+            "-i", audio_path,
+            "-f", "s16le", "-ac", "1", "-ar", str(DECODE_RATE), "-"
+        ],
+        stdout=subprocess.PIPE,
+        check=True
+    )
+    return AudioSegment(
+        data=result.stdout, sample_width=2, frame_rate=DECODE_RATE, channels=1
+    )
+
+
+def split_audio(audio_path):
+    """
+    Splits a recording into mp3 chunks of at most CHUNK_MAX_MS, cut at pauses.
+
+    Each window is decoded on its own with an input-side seek, so only one
+    window of PCM is in memory and no audio is decoded twice.
+    """
+
+    chunks = []
+    start_ms = 0
+    while True:
+        window = decode_window(audio_path, start_ms)
+
+        # Nothing left to read → done
+        if len(window) == 0:
+            break
+
+        # Full window → move the cut back to the last 0.7s pause in its
+        # final CUT_SEARCH_MS, so no word is split in half.
+        # (A shorter window is the end of the recording and is kept whole.)
+        cut_ms = len(window)
+        if cut_ms >= CHUNK_MAX_MS - 1000:
+            search_from = cut_ms - CUT_SEARCH_MS
+            pauses = detect_silence(
+                window[search_from:],
+                min_silence_len=700,
+                silence_thresh=-40,
+                seek_step=SILENCE_SEEK_MS
+            )
+            if pauses:
+                pause_start, pause_end = pauses[-1]
+                cut_ms = search_from + (pause_start + pause_end) // 2
+
+        # Keep only the compressed mp3 bytes, not the decoded audio
+        buffer = io.BytesIO()
+        window[:cut_ms].export(buffer, format="mp3")
+        chunks.append(buffer.getvalue())
+
+        # The next window starts right where this chunk was cut
+        start_ms += cut_ms
+
+    return chunks
+
+
+def transcribe_chunk(chunk, model):
+    """
+    Transcribes one mp3 chunk (bytes) produced by split_audio().
+    """
+
+    with TRANSCRIBE_SLOTS:
+        transcription = get_client().audio.transcriptions.create(
+            file=("chunk.mp3", chunk),   # (filename, bytes) so the API knows the format
+            model=model
+        )
+    return transcription.text
+
+
+async def transcribe_all(audio_paths):
+    """
+    Transcribes several audio files concurrently and returns texts in input order.
+    """
+
+    async def transcribe_one(audio_path):
+        # The OpenAI SDK call blocks while waiting on the network,
+        # so run it in a worker thread and let other files proceed.
+        # TRANSCRIBE_SLOTS limits how many requests actually run at once.
+        return await asyncio.to_thread(transcribe_audio, audio_path)
+
+    return await asyncio.gather(*(transcribe_one(path) for path in audio_paths))
+
+
+# -------------------------------
+# STEP 2 — GENERATE AI NOTES
+# -------------------------------
+
+# Raw model output is written here token-by-token while it is being generated
+DRAFT_PATH = "meeting_notes_draft.txt"
+
+# Prompt engineering for structured output.
+# Kept short on purpose: every instruction token is paid on every call.
+# The headings must match what segregate_notes() looks for.
+# Built once here; each call only appends the transcript.
+PROMPT_PREFIX = """Write meeting notes for this transcript using exactly these headings, each followed by "- " bullets:
+SUMMARY:
+KEY POINTS:
+DECISIONS:
+ACTION ITEMS:
+
+Transcript:
+"""
+
+
+def generate_meeting_notes(transcript):
+    """
+    Sends transcript to AI and generates structured meeting notes.
+    """
+
+    # Limit transcript length (cost + token safety), measured in real tokens
+    transcript = truncate_to_tokens(transcript)
+
+    prompt = PROMPT_PREFIX + transcript
+
+    model = "gpt-5-mini"  # Fast & affordable model
+
+    def call_model():
+        parts = []
+        completed = False
+
+        # Send prompt to GPT model and stream the answer back.
+        # Each text piece is written to the draft file as soon as it arrives,
+        # so you can watch the notes appear instead of waiting for the end.
+        with open(DRAFT_PATH, "w", encoding="utf-8") as draft:
+            with get_client().responses.create(
+                model=model,
+                input=prompt,
+                stream=True
+            ) as stream:
+                for event in stream:
+                    if event.type == "response.output_text.delta":
+                        draft.write(event.delta)
+                        draft.flush()
+                        parts.append(event.delta)
+
+                    elif event.type == "response.completed":
+                        completed = True
+
+                    # The model stopped early (error, token limit, ...)
+                    elif event.type in ("response.failed", "response.incomplete", "error"):
+                        raise RuntimeError(f"Meeting notes generation stopped early: {event.type}")
+
+        # A stream that just ends without "response.completed" was cut off.
+        # Raising here means get_or_set never caches partial notes.
+        if not completed:
+            raise RuntimeError("Meeting notes stream ended before the response completed")
+
+        # Return the full generated meeting notes text
+        return "".join(parts)
+
+    # Keyed on the exact prompt. No "similar transcript" (semantic) caching:
+    # two meetings that merely look alike can have different decisions.
+    # The same recording already reuses its cached transcript (file hash),
+    # so it produces this exact prompt again and hits the cache anyway.
+    return get_or_set(cache_key(model, prompt), call_model)
+
+
+# -------------------------------
+# STEP 3 — SAFE PARSING
+# -------------------------------
+
+# One precompiled pattern instead of four startswith() checks per line.
+# The matched group is the section name itself.
+HEADING_RE = re.compile(r"^(SUMMARY|KEY POINTS|DECISIONS|ACTION ITEMS)\b")
+
+# First letters of the headings above (any case). Lines starting with
+# anything else (e.g. "- " bullets) cannot be headings, so we skip
+# upper() and the regex for them.
+HEADING_FIRST_CHARS = frozenset("SKDAskda")
+
+
+def segregate_notes(notes_text):
+    """
+    Extract sections safely even if formatting slightly changes.
+    """
+
+    # Dictionary to store sections
+    sections = {
+        "SUMMARY": "",
+        "KEY POINTS": "",
+        "DECISIONS": "",
+        "ACTION ITEMS": ""
+    }
+
+    current_section = None
+
+    # Loop through each line of AI output
+    for line in notes_text.splitlines():
+        clean = line.strip()
+
+        # Blank lines carry no content
+        if not clean:
+            continue
+
+        # Detect headings (cheap first-letter check before upper() + regex)
+        heading = None
+        if clean[0] in HEADING_FIRST_CHARS:
+            heading = HEADING_RE.match(clean.upper())
+
+        if heading:
+            current_section = heading.group(1)
+
+        # Append content to detected section
+        elif current_section:
+            sections[current_section] += clean + "\n"
+
+    # Fallback safety if section empty
+    for key in sections:
+        if not sections[key].strip():
+            sections[key] = "No information detected.\n"
+
+    return sections
+
+
+# -------------------------------
+# STEP 4 — SAVE NOTES TO FILE
+# -------------------------------
+
+def save_notes(sections):
+    """Save meeting notes to text file."""
+
+     # sections is a dictionary like:
+    # {
+    #   "SUMMARY": "text...",
+    #   "KEY POINTS": "text...",
+    #   "DECISIONS": "text...",
+    #   "ACTION ITEMS": "text..."
+    # }
+    
+    # Loop through dictionary key-value pairs
+    # title   → dictionary KEY   (e.g., SUMMARY)
+    # content → dictionary VALUE (actual notes text)
+
+    # Build the whole file in memory first, then write it in one go
+    body = "".join(
+        f"{title}\n{'-' * 40}\n{content}\n"
+        for title, content in sections.items()
+    )
+    Path("meeting_notes.txt").write_text(body, encoding="utf-8")
+
+
+# -------------------------------
+# MAIN PROGRAM FLOW
+# -------------------------------
+
+async def main():
+    print("🎙️ AI Meeting Notes Generator Started")
+
+    # Add more recordings here (e.g. one file per speaker or per part)
+    audio_paths = ["meeting.mp3"]
+
+    print("Transcribing audio...")
+    transcripts = await transcribe_all(audio_paths)
+    transcript = "\n".join(transcripts)
+
+    print("Generating AI notes...")
+    notes = await asyncio.to_thread(generate_meeting_notes, transcript)
+
+    sections = segregate_notes(notes)
+
+    save_notes(sections)
+
+    print("✅ Meeting notes saved successfully!")
@@ -4,32 +4,211 @@
 # This script:
 # 1. Reads text from a PDF file
 # 2. Sends the text to an AI model
-# 3. Gets a summarized version
+# 3. Gets a summarized version (cached on disk for reruns)
 # 4. Prints the summary
 # ============================================================
 
 from pypdf import PdfReader          # Used to read and extract text from PDF files
 from dotenv import load_dotenv       # Used to load environment variables from .env file
 import os                            # Used to access environment variables
+import sys                           # Used to read PDF paths from the command line
+import asyncio                       # Used to summarize several PDFs at the same time
 from openai import OpenAI            # OpenAI client to interact with AI models
+from openai import DefaultHttpxClient  # HTTP client with the SDK's default settings
+import importlib.util                # Used to check if optional packages are installed
+import importlib.metadata            # Used to read installed package versions
+from functools import lru_cache      # Used to build the client only once
+import threading                     # Used to guard client creation across threads
+import hashlib                       # Used to build deterministic cache keys
+import re                            # Used to squeeze repeated whitespace
+import tiktoken                      # Used to count tokens exactly like the model does
+import json                          # Used to store cached AI responses on disk
+import tempfile                      # Used to write cache files atomically
+import time                          # Used to expire old cache entries
+from pathlib import Path             # Used to work with cache file paths
+
+# Optional: pypdfium2 wraps Google's PDFium (C++) engine and extracts text
+# several times faster than pure-Python pypdf. If it is not installed,
+# we simply fall back to pypdf.
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
 
 
 # -------------------------------
-# LOAD ENVIRONMENT VARIABLES
+# LOAD ENVIRONMENT VARIABLES + CREATE CLIENT
 # -------------------------------
 
-# This reads the .env file and loads variables into the system environment
-# Example: OPENAI_API_KEY=sk-xxxx
-load_dotenv()
+# lru_cache runs _create_client once and then keeps returning the same client,
+# so the .env file is read once and every call shares one connection pool.
+# lru_cache alone does not stop several threads (batch_summarize) from
+# running it at the same time on the first call, so a lock guards it.
+_client_lock = threading.Lock()
 
-# Create OpenAI client using API key from environment
-# This avoids hardcoding the API key (security best practice)
-# Creates a client to communicate with OpenAI servers
-client = OpenAI(
-    api_key=os.getenv("OPENAI_API_KEY")
+
+def get_client():
+    """
+    Returns the shared OpenAI client (created on first use).
+
+    Returns:
+    OpenAI: Client to communicate with OpenAI servers
+    """
+
+    with _client_lock:
+        return _create_client()
+
+
+@lru_cache(maxsize=1)
+def _create_client():
+    """
+    Loads .env and builds the OpenAI client (only called through get_client).
+    """
+
+    # This reads the .env file and loads variables into the system environment
+    # Example: OPENAI_API_KEY=sk-xxxx
+    load_dotenv()
+
+    # Create OpenAI client using API key from environment
+    # This avoids hardcoding the API key (security best practice)
+    return OpenAI(
+        api_key=os.getenv("OPENAI_API_KEY"),
+        # One shared HTTP client keeps its connections open between requests.
+        # With the optional "h2" package, HTTP/2 sends every request over a
+        # single TLS connection instead of opening a new one.
+        http_client=DefaultHttpxClient(http2=importlib.util.find_spec("h2") is not None)
+    )
+
+
+# -------------------------------
+# TOKEN BUDGET
+# -------------------------------
+
+# Maximum number of input tokens sent to the model per request
+MAX_TOKENS = 3000
+
+# gpt-5-mini uses the same tokenizer (o200k_base) as gpt-4o.
+# Loading it is slow, so we do it once when the script starts.
+ENCODING = tiktoken.encoding_for_model("gpt-4o")
+
+
+def truncate_to_tokens(text, max_tokens=MAX_TOKENS):
+    """
+    Cleans up whitespace and cuts text down to at most max_tokens tokens.
+
+    Parameters:
+    text (str): Input text
+    max_tokens (int): Token budget
+
+    Returns:
+    str: Text that fits inside the token budget
+    """
+
+    # Repeated spaces and blank lines cost tokens but carry no meaning
+    text = re.sub(r"[ \t]+", " ", text)
+    text = re.sub(r"\s*\n\s*", "\n", text).strip()
+
+    # Encode once; only decode again if we actually need to cut
+    tokens = ENCODING.encode(text)
+    if len(tokens) <= max_tokens:
+        return text
+    return ENCODING.decode(tokens[:max_tokens])
+
+
+# -------------------------------
+# RESPONSE CACHE
+# -------------------------------
+
+# Reruns with the same PDF send the exact same prompt to the model.
+# Instead of paying for another network call, we store each answer in
+# .llm_cache/<sha256>.json and read it back next time (milliseconds).
+# The token/cache helpers are copied in 1_PART/main.py and
+# 2_PART/meeting_notes/core.py (each script runs on its own); keep them identical.
+CACHE_DIR = Path(".llm_cache")
+CACHE_TTL_DAYS = 30
+
+# Extracted PDF text is cached too, keyed by the PDF's bytes and by the
+# extraction library + version (a new version may extract text differently)
+PDF_CACHE_DIR = Path(".pdf_cache")
+PDF_BACKEND = (
+    f"pypdfium2-{importlib.metadata.version('pypdfium2')}"
+    if pdfium is not None
+    else f"pypdf-{importlib.metadata.version('pypdf')}"
 )
 
 
+def cache_key(model, prompt):
+    """
+    Builds a deterministic cache key for a model + prompt pair.
+
+    Parameters:
+    model (str): Model name used for the request
+    prompt (str): Exact prompt text sent to the model
+
+    Returns:
+    str: SHA256 hex digest
+    """
+
+    # "\0" separates the two parts so ("ab", "c") and ("a", "bc") never collide
+    return hashlib.sha256(f"{model}\0{prompt}".encode("utf-8")).hexdigest()
+
+
+def file_sha256(path):
+    """
+    Hashes a file's bytes (read in chunks, so big files stay out of memory).
+
+    Parameters:
+    path (str): Path to the file
+
+    Returns:
+    str: SHA256 hex digest
+    """
+
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        # Read 1 MB at a time until read() returns b"" (end of file)
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def get_or_set(key, compute, ttl_days=CACHE_TTL_DAYS, cache_dir=CACHE_DIR):
+    """
+    Returns the cached value for key, or calls compute() and caches its result.
+
+    Parameters:
+    key (str): Cache key (see cache_key)
+    compute (callable): Function that produces the value on a cache miss
+    ttl_days (float): How long a cached value stays valid
+    cache_dir (Path): Folder where cache files are stored
+
+    Returns:
+    str: Cached or freshly computed value
+    """
+
+    cache_path = cache_dir / f"{key}.json"
+
+    # Cache hit: return the stored answer if it is not too old
+    if cache_path.exists():
+        entry = json.loads(cache_path.read_text(encoding="utf-8"))
+        if time.time() - entry["created_at"] < ttl_days * 86400:
+            return entry["value"]
+
+    # Cache miss: do the real (slow) work
+    value = compute()
+
+    # Write to a temporary file first and then rename it,
+    # so an interrupted run never leaves a half-written cache file
+    cache_dir.mkdir(exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        "w", dir=cache_dir, suffix=".tmp", delete=False, encoding="utf-8"
+    ) as tmp_file:
+        json.dump({"created_at": time.time(), "value": value}, tmp_file)
+    os.replace(tmp_file.name, cache_path)
+
+    return value
+
+
 # -------------------------------
 # FUNCTION: READ PDF FILE
 # -------------------------------
@@ -37,6 +216,9 @@ def read_pdf(file_path):
     """
     Reads text from a PDF file and returns it as a string.
 
+    Uses the fast PDFium engine when available, otherwise pypdf.
+    Results are cached, so an unchanged PDF is only parsed once.
+
     Parameters:
     file_path (str): Path to the PDF file
 
@@ -44,19 +226,56 @@ def read_pdf(file_path):
     str: Extracted text from the PDF
     """
 
+    key = f"{file_sha256(file_path)}-{PDF_BACKEND}"
+    return get_or_set(
+        key, lambda: extract_pdf_text(file_path), cache_dir=PDF_CACHE_DIR
+    )
+
+
+def extract_pdf_text(file_path):
+    """
+    Extracts PDF text with PDFium if installed, falling back to pypdf.
+    """
+
+    if pdfium is not None:
+        try:
+            return read_pdf_pdfium(file_path)
+        except pdfium.PdfiumError:
+            # PDFium could not open this file → let pypdf try instead
+            pass
+
+    return read_pdf_pypdf(file_path)
+
+
+def read_pdf_pdfium(file_path):
+    """
+    Extracts PDF text with pypdfium2 (native code, fast path).
+    """
+
+    pdf = pdfium.PdfDocument(file_path)
+    try:
+        # One "text page" per PDF page; get_text_range() returns all its text
+        return "\n".join(page.get_textpage().get_text_range() for page in pdf)
+    finally:
+        # Free the native PDFium memory right away
+        pdf.close()
+
+
+def read_pdf_pypdf(file_path):
+    """
+    Extracts PDF text with pypdf (pure Python, always available).
+    """
+
     # Create PdfReader object to open the PDF
     reader = PdfReader(file_path)
 
-    # Variable to store all extracted text
-    text = ""
-
-    # Loop through each page in the PDF
-    for page in reader.pages:
-        # Extract text from the page and append to text variable
-        text += page.extract_text()
+    # Collect page texts in a list and join them once at the end.
+    # "text += ..." would copy the whole string again for every page.
+    # extract_text() can return None for image-only pages, so use "" instead.
+    parts = [page.extract_text() or "" for page in reader.pages]
 
     # Return the full text from the PDF
-    return text
+    return "".join(parts)
 
 
 # -------------------------------
@@ -75,12 +294,11 @@ def summarize_text(text):
 
     # Limit text size to control cost and avoid token overflow
     # AI models charge per token (large input = higher cost)
-    # text is a string
 
-    # Strings are sliced by character index
-  
-    # Each letter, space, or symbol = 1 character
-    text = text[:4000]
+    # Slicing by characters (text[:4000]) only guesses the token count:
+    # English is ~4 characters per token, code and Unicode are not.
+    # Counting real tokens lets us fill the budget exactly.
+    text = truncate_to_tokens(text)
 
     # Send request to OpenAI using Responses API
 
@@ -88,40 +306,109 @@ def summarize_text(text):
     # Text → tokens
     #Tokens → AI model AI predicts next words # Summary returned
     # “AI doesn’t understand language — it predicts patterns.”
-    response = client.responses.create(
-        model="gpt-5-mini",  # Lightweight, fast, low-cost model
-        input=(
-            "Summarize the following text in simple and clear language:\n\n"
-            + text
-        )
+    model = "gpt-5-mini"  # Lightweight, fast, low-cost model
+    prompt = (
+        "Summarize the following text in simple and clear language:\n\n"
+        + text
     )
 
-    # Extract and return only the readable text output
-    # API response is JSON
+    def call_model():
+        response = get_client().responses.create(
+            model=model,
+            input=prompt
+        )
 
-# This extracts only the final readable answer
-    return response.output_text
+        # Extract and return only the readable text output
+        # API response is JSON
+
+        # This extracts only the final readable answer
+        return response.output_text
+
+    # Same model + same prompt → reuse the saved answer instead of calling the API
+    return get_or_set(cache_key(model, prompt), call_model)
 
 
 # -------------------------------
-# MAIN PROGRAM EXECUTION
+# FUNCTION: SUMMARIZE MANY PDFS AT ONCE
 # -------------------------------
 
-# Step 1: Read text from PDF
-pdf_text = read_pdf("sample.pdf")
+# Max PDFs processed at the same time (keeps us under API rate limits)
+MAX_CONCURRENT_SUMMARIES = 4
 
-# Step 2: Validate PDF content
-# Prevents summarizing empty content
-# Avoids wasting API calls
-if not pdf_text.strip():
-    raise ValueError("PDF contains no readable text")
 
-# Step 3: Generate AI summary
-summary = summarize_text(pdf_text)
+def summarize_pdf(file_path):
+    """
+    Reads one PDF and returns its AI summary.
+
+    Parameters:
+    file_path (str): Path to the PDF file
+
+    Returns:
+    str: AI-generated summary
+    """
+
+    pdf_text = read_pdf(file_path)
+
+    # Validate PDF content
+    # Prevents summarizing empty content
+    # Avoids wasting API calls
+    if not pdf_text.strip():
+        raise ValueError(f"{file_path}: PDF contains no readable text")
+
+    return summarize_text(pdf_text)
+
+
+async def batch_summarize(paths, workers=MAX_CONCURRENT_SUMMARIES):
+    """
+    Summarizes several PDFs concurrently.
+
+    Most of the time is spent waiting for the API, so while one PDF
+    waits for its answer, the others can already be sent.
+
+    Parameters:
+    paths (list): Paths to the PDF files
+    workers (int): Max PDFs processed at the same time
+
+    Returns:
+    list: One summary (str) or raised exception per path, in input order
+    """
+
+    semaphore = asyncio.Semaphore(workers)
+
+    async def summarize_one(path):
+        async with semaphore:
+            # summarize_pdf blocks on disk + network, so run it in a thread
+            return await asyncio.to_thread(summarize_pdf, path)
+
+    # return_exceptions=True → one bad PDF does not cancel the others
+    return await asyncio.gather(
+        *(summarize_one(path) for path in paths), return_exceptions=True
+    )
+
+
+# -------------------------------
+# MAIN PROGRAM EXECUTION
+# -------------------------------
 
-# Step 4: Display result
-print("\n========== AI GENERATED SUMMARY ==========\n")
-print(summary)
+# Step 1: Choose PDFs (e.g. python main.py a.pdf b.pdf), default sample.pdf
+pdf_paths = sys.argv[1:] or ["sample.pdf"]
+
+# Step 2: Read, validate and summarize all PDFs concurrently
+summaries = asyncio.run(batch_summarize(pdf_paths))
+
+# Step 3: Display results
+failed = False
+for pdf_path, summary in zip(pdf_paths, summaries):
+    if isinstance(summary, Exception):
+        print(f"\n❌ Could not summarize {pdf_path}: {summary}")
+        failed = True
+    else:
+        print(f"\n========== AI GENERATED SUMMARY: {pdf_path} ==========\n")
+        print(summary)
+
+# Step 4: Exit with an error code if any PDF failed (useful in scripts / CI)
+if failed:
+    sys.exit(1)
 
 
 